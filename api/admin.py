@@ -1,8 +1,45 @@
 from django.contrib import admin
-from .models import Post, Follow, Like, Profile, Comment
+from .models import Post, Follow, Like, Profile, Comment, ArchivedPost
+from .pagination import EstimatedCountPaginator
 
-admin.site.register(Post)
-admin.site.register(Follow)
-admin.site.register(Like)
-admin.site.register(Comment)
-admin.site.register(Profile)
\ No newline at end of file
+class EstimatedCountAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    # Skip the extra unfiltered COUNT(*) the changelist runs when a filter is active
+    show_full_result_count = False
+
+@admin.register(Post)
+class PostAdmin(EstimatedCountAdmin):
+    list_display = ('id', 'user', 'created_at')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
+    search_fields = ('content',)
+
+@admin.register(Follow)
+class FollowAdmin(EstimatedCountAdmin):
+    list_display = ('id', 'follower', 'following', 'created_at')
+    list_select_related = ('follower', 'following')
+    raw_id_fields = ('follower', 'following')
+
+@admin.register(Like)
+class LikeAdmin(EstimatedCountAdmin):
+    list_display = ('id', 'user', 'post', 'created_at')
+    list_select_related = ('user', 'post__user')
+    raw_id_fields = ('user', 'post')
+
+@admin.register(Comment)
+class CommentAdmin(EstimatedCountAdmin):
+    list_display = ('id', 'user', 'post', 'created_at')
+    list_select_related = ('user', 'post__user')
+    raw_id_fields = ('user', 'post')
+
+@admin.register(Profile)
+class ProfileAdmin(EstimatedCountAdmin):
+    list_display = ('id', 'user')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
+
+@admin.register(ArchivedPost)
+class ArchivedPostAdmin(EstimatedCountAdmin):
+    list_display = ('id', 'user', 'created_at', 'archived_at')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
@@ -0,0 +1,47 @@
+from .models import ArchivedPost
+from .serializers import PostSerializer, ArchivedPostSerializer
+
+class ArchiveTimeline:
+    """
+    Read-only sequence that lists live posts first and continues into the
+    archive once they run out. Archived posts are always older than the live
+    ones, so the combined list stays ordered newest first. Supports the
+    ``count()``/slicing interface that Django's Paginator relies on.
+
+    ``counted_posts`` is the plain queryset used for counting, so annotations
+    and joins on ``posts`` are only paid for on the sliced page.
+    """
+
+    def __init__(self, posts, archived_posts, counted_posts=None):
+        self.posts = posts
+        self.archived_posts = archived_posts
+        self.counted_posts = posts if counted_posts is None else counted_posts
+        self._posts_count = None
+
+    def posts_count(self):
+        if self._posts_count is None:
+            self._posts_count = self.counted_posts.count()
+        return self._posts_count
+
+    def count(self):
+        return self.posts_count() + self.archived_posts.count()
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start, stop = index.start or 0, index.stop
+        hot = self.posts_count()
+        items = list(self.posts[start:stop]) if start < hot else []
+        if stop is None or stop > hot:
+            cold_stop = None if stop is None else stop - hot
+            items += list(self.archived_posts[max(start - hot, 0):cold_stop])
+        return items
+
+def serialize_timeline(items, context):
+    return [
+        (ArchivedPostSerializer if isinstance(item, ArchivedPost) else PostSerializer)(item, context=context).data
+        for item in items
+    ]
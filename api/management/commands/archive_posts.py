@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+from api.models import Post, Comment, Like, ArchivedPost
+from api.pagination import forget_estimated_count
+from api.serializers import CommentSerializer
+
+
+class Command(BaseCommand):
+    help = "Move posts older than the archive age, with their comments and likes, into the archive table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.POST_ARCHIVE_AFTER_DAYS,
+            help='Archive posts created more than this many days ago (default: POST_ARCHIVE_AFTER_DAYS).',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Number of posts moved per transaction.',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report how many posts would be archived without moving them.',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        candidates = Post.objects.filter(created_at__lt=cutoff).order_by('pk')
+
+        if options['dry_run']:
+            self.stdout.write(f"{candidates.count()} posts older than {cutoff:%Y-%m-%d} would be archived.")
+            return
+
+        archived = 0
+        while True:
+            moved = self.archive_batch(candidates, options['batch_size'])
+            if not moved:
+                break
+            archived += moved
+
+        forget_estimated_count(Post, Comment, Like, ArchivedPost)
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} posts older than {cutoff:%Y-%m-%d}."))
+
+    @transaction.atomic
+    def archive_batch(self, candidates, batch_size):
+        if connection.features.has_select_for_update_of:
+            # Locking the posts blocks new comments and likes on them until we commit
+            candidates = candidates.select_for_update(of=('self',))
+        pks = list(candidates.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return 0
+
+        posts = list(
+            Post.objects.filter(pk__in=pks).order_by('pk')
+            .prefetch_related('comments__user__profile', Prefetch('likes', queryset=Like.objects.only('id', 'post')))
+        )
+        ArchivedPost.objects.bulk_create([self.to_archive(post) for post in posts])
+
+        # Comments and likes go with the post through ON DELETE CASCADE, so make
+        # sure nothing was added since they were copied
+        comment_ids = [comment.id for post in posts for comment in post.comments.all()]
+        like_ids = [like.id for post in posts for like in post.likes.all()]
+        if (
+            Comment.objects.filter(post_id__in=pks).exclude(pk__in=comment_ids).exists()
+            or Like.objects.filter(post_id__in=pks).exclude(pk__in=like_ids).exists()
+        ):
+            raise CommandError("Posts received new comments or likes while being archived; nothing was moved from this batch, rerun the command.")
+
+        Post.objects.filter(pk__in=pks).delete()
+        return len(posts)
+
+    def to_archive(self, post):
+        comments = sorted(post.comments.all(), key=lambda c: c.created_at)
+        return ArchivedPost(
+            id=post.id,
+            user_id=post.user_id,
+            content=post.content,
+            image=post.image.name or None,
+            video=post.video.name or None,
+            audio=post.audio.name or None,
+            created_at=post.created_at,
+            updated_at=post.updated_at,
+            likes_count=len(post.likes.all()),
+            comments_count=len(comments),
+            # Stored in the same shape the live endpoints return
+            comments=CommentSerializer(comments, many=True).data,
+        )
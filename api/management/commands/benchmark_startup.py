@@ -0,0 +1,48 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Runs in a fresh interpreter so imports are measured cold, like a new gunicorn worker
+BOOT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+booted = time.perf_counter()
+from django.test import Client
+status = Client().get(sys.argv[1]).status_code
+print(json.dumps({'boot': booted - start, 'first_request': time.perf_counter() - booted, 'status': status}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Measure WSGI worker boot time and first-request latency in fresh interpreters."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/', help='URL requested after boot (default: /api/).')
+        parser.add_argument('--runs', type=int, default=5, help='Number of cold starts to measure.')
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'))
+        boot, first, statuses = [], [], set()
+        for _ in range(options['runs']):
+            result = subprocess.run(
+                [sys.executable, '-c', BOOT_SCRIPT, options['path']],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+            )
+            timings = json.loads(result.stdout.strip().splitlines()[-1])
+            boot.append(timings['boot'] * 1000)
+            first.append(timings['first_request'] * 1000)
+            statuses.add(timings['status'])
+
+        codes = ', '.join(str(code) for code in sorted(statuses))
+        self.stdout.write(f"GET {options['path']} -> {codes} over {options['runs']} cold starts (ms):")
+        for label, samples in (('worker boot', boot), ('first request', first)):
+            self.stdout.write(
+                f"  {label:<14} median {statistics.median(samples):8.1f}  min {min(samples):8.1f}  max {max(samples):8.1f}"
+            )
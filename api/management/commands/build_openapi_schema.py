@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from api.schema import schema_info, prebuilt_schema_path
+
+
+class Command(BaseCommand):
+    help = "Generate the OpenAPI schema into STATIC_ROOT so /swagger/ and /redoc/ serve it as a static file."
+
+    def handle(self, *args, **options):
+        from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+        from drf_yasg.generators import OpenAPISchemaGenerator
+
+        schema = OpenAPISchemaGenerator(schema_info()).get_schema(request=None, public=True)
+        for format, codec in (('.json', OpenAPICodecJson), ('.yaml', OpenAPICodecYaml)):
+            path = prebuilt_schema_path(format)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(codec(validators=[]).encode(schema))
+            self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
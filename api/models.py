@@ -50,4 +50,30 @@ class Profile(models.Model):
     avatar = models.ImageField(upload_to='profiles/avatars/', blank=True, null=True)
 
     def __str__(self):
-        return f"{self.user.username}'s Profile"
\ No newline at end of file
+        return f"{self.user.username}'s Profile"
+
+class ArchivedPost(models.Model):
+    """
+    Cold-storage copy of a Post moved out of the hot tables by the
+    ``archive_posts`` management command. Comments are folded into a JSON
+    column and likes are kept as an aggregate count, so a single row
+    replaces the post and all of its dependent rows.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_posts')
+    content = models.TextField(blank=True)
+    image = models.ImageField(upload_to='posts/images/', blank=True, null=True)
+    video = models.FileField(upload_to='posts/videos/', blank=True, null=True)
+    audio = models.FileField(upload_to='posts/audios/', blank=True, null=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    likes_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
+    comments = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['user', '-created_at'])]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.created_at} (archived)"
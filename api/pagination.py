@@ -0,0 +1,96 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+def estimated_count(queryset):
+    """
+    Return an approximate row count for an unfiltered queryset.
+
+    On PostgreSQL this reads the planner statistics in ``pg_class``; other
+    backends use an exact count cached for ``ESTIMATED_COUNT_CACHE_TIMEOUT``
+    seconds. Filtered querysets, and tables with fewer than
+    ``ESTIMATED_COUNT_THRESHOLD`` rows, are counted exactly.
+    """
+    query = queryset.query
+    if query.where or query.distinct or query.is_sliced or query.group_by is not None or query.combinator:
+        return queryset.count()
+
+    table = queryset.model._meta.db_table
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+            row = cursor.fetchone()
+        # reltuples is -1 for tables that have never been analyzed
+        if row and row[0] >= settings.ESTIMATED_COUNT_THRESHOLD:
+            return row[0]
+        return queryset.count()
+
+    cache = caches[settings.ESTIMATED_COUNT_CACHE]
+    key = estimated_count_key(queryset.model, queryset.db)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        if count >= settings.ESTIMATED_COUNT_THRESHOLD:
+            cache.set(key, count, settings.ESTIMATED_COUNT_CACHE_TIMEOUT)
+    return count
+
+def estimated_count_key(model, using='default'):
+    return f'estimated-count:{using}:{model._meta.db_table}'
+
+def forget_estimated_count(*models, using='default'):
+    """
+    Drop cached counts after bulk changes, such as archiving, so they are
+    recomputed on the next request.
+    """
+    caches[settings.ESTIMATED_COUNT_CACHE].delete_many([estimated_count_key(model, using) for model in models])
+
+class EstimatedCountPage(Page):
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that avoids a full ``COUNT(*)`` on large tables.
+    Usable as ``ModelAdmin.paginator`` and behind ``EstimatedCountPagination``.
+
+    The estimate is only reported as the total. Pages are sliced straight
+    from the queryset, fetching one extra row to tell whether a next page
+    exists, so a stale estimate never hides rows.
+    """
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            return estimated_count(self.object_list)
+        return super().count
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages['no_results'])
+        return EstimatedCountPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+class EstimatedCountPagination(PageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
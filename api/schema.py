@@ -0,0 +1,60 @@
+from functools import lru_cache
+from pathlib import Path
+from django.conf import settings
+from django.shortcuts import redirect
+from django.templatetags.static import static
+
+SCHEMA_DIR = 'openapi'
+
+def schema_info():
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="Social Media API",
+        default_version='v1',
+        description="API documentation for Social Media Platform",
+        terms_of_service="https://www.google.com/policies/terms/",
+        contact=openapi.Contact(email="contact@social.local"),
+        license=openapi.License(name="BSD License"),
+    )
+
+@lru_cache(maxsize=None)
+def get_schema_view():
+    """
+    Build the drf_yasg schema view on first use, so workers don't pay for
+    importing drf_yasg when loading the URLconf.
+    """
+    from rest_framework import permissions
+    from drf_yasg.views import get_schema_view as yasg_schema_view
+
+    return yasg_schema_view(
+        schema_info(),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+def prebuilt_schema_path(format):
+    return Path(settings.STATIC_ROOT) / SCHEMA_DIR / f'swagger{format}'
+
+def prebuilt_schema_redirect(format):
+    """
+    Redirect to the schema built by `manage.py build_openapi_schema`, or return
+    None if it hasn't been built. In DEBUG the schema is always generated live,
+    so a locally built file can't go stale.
+    """
+    if not settings.DEBUG and prebuilt_schema_path(format).exists():
+        return redirect(static(f'{SCHEMA_DIR}/swagger{format}'))
+    return None
+
+def schema_spec(request, format):
+    return prebuilt_schema_redirect(format) or get_schema_view().without_ui(cache_timeout=0)(request, format=format)
+
+def schema_ui(renderer):
+    def view(request):
+        # The UI fetches its spec from its own URL with ?format=openapi
+        if request.GET.get('format') == 'openapi':
+            response = prebuilt_schema_redirect('.json')
+            if response:
+                return response
+        return get_schema_view().with_ui(renderer, cache_timeout=0)(request)
+    return view
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import Post, Follow, Comment, Profile
+from .models import Post, Follow, Comment, Profile, ArchivedPost
 
 class ProfileSerializer(serializers.ModelSerializer):
     class Meta:
@@ -41,15 +41,47 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'post', 'content', 'created_at']
         read_only_fields = ['post']
 
+class LikesCountField(serializers.IntegerField):
+    """
+    Uses a ``likes_total`` annotation when the queryset provides one,
+    otherwise counts the post's likes.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(source='*', read_only=True, **kwargs)
+
+    def to_representation(self, post):
+        likes_total = getattr(post, 'likes_total', None)
+        if likes_total is None:
+            likes_total = post.likes.count()
+        return likes_total
+
 class PostSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     comments = CommentSerializer(many=True, read_only=True)
-    likes_count = serializers.IntegerField(source='likes.count', read_only=True)
+    likes_count = LikesCountField()
 
     class Meta:
         model = Post
         fields = ['id', 'user', 'content', 'image', 'video', 'audio', 'created_at', 'likes_count', 'comments']
 
+class PostPageSerializer(serializers.Serializer):
+    """
+    Shape of a paginated page of posts, used to document the user timeline.
+    """
+    count = serializers.IntegerField()
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+    results = PostSerializer(many=True)
+
+class ArchivedPostSerializer(serializers.ModelSerializer):
+    user = UserSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedPost
+        fields = ['id', 'user', 'content', 'image', 'video', 'audio', 'created_at', 'likes_count', 'comments', 'archived_at']
+        read_only_fields = fields
+
 class FollowSerializer(serializers.ModelSerializer):
     follower = UserSerializer(read_only=True)
     following = UserSerializer(read_only=True)
@@ -1,8 +1,19 @@
-from django.test import TestCase
+from datetime import timedelta
+import tempfile
+from io import StringIO
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db.models import Count
+from unittest import mock
+from django.core.management import call_command, CommandError
+from django.db import IntegrityError
+from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
-from .models import Post
+from .models import Post, Comment, Like, ArchivedPost
+from .management.commands.archive_posts import Command
+from .pagination import EstimatedCountPaginator
 
 class UserRegistrationTestCase(TestCase):
     def setUp(self):
@@ -30,3 +41,154 @@ class PostTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Post.objects.count(), 1)
         self.assertEqual(Post.objects.get().content, "Hello World")
+
+class ArchivePostsTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.other = User.objects.create_user(username='other', password='testpassword')
+        self.old_post = Post.objects.create(user=self.user, content="Old news")
+        Comment.objects.create(user=self.other, post=self.old_post, content="First!")
+        Like.objects.create(user=self.other, post=self.old_post)
+        Post.objects.filter(pk=self.old_post.pk).update(created_at=timezone.now() - timedelta(days=400))
+        self.new_post = Post.objects.create(user=self.user, content="Fresh")
+
+    def test_archive_moves_old_posts(self):
+        call_command('archive_posts', days=365, stdout=StringIO())
+        self.assertEqual(list(Post.objects.values_list('pk', flat=True)), [self.new_post.pk])
+        self.assertEqual(Comment.objects.count(), 0)
+        self.assertEqual(Like.objects.count(), 0)
+        archived = ArchivedPost.objects.get(pk=self.old_post.pk)
+        self.assertEqual(archived.likes_count, 1)
+        self.assertEqual(archived.comments_count, 1)
+        self.assertEqual(archived.comments[0]['content'], "First!")
+
+    def test_archive_conflict_keeps_live_post(self):
+        ArchivedPost.objects.create(
+            id=self.old_post.pk, user=self.user, created_at=timezone.now(), updated_at=timezone.now(),
+        )
+        with self.assertRaises(IntegrityError):
+            call_command('archive_posts', days=365, stdout=StringIO())
+        self.assertTrue(Post.objects.filter(pk=self.old_post.pk).exists())
+        self.assertEqual(Like.objects.count(), 1)
+
+    def test_archive_aborts_when_comment_added_during_batch(self):
+        to_archive = Command.to_archive
+
+        def add_comment_then_archive(command, post):
+            Comment.objects.create(user=self.user, post=post, content="Late reply")
+            return to_archive(command, post)
+
+        with mock.patch.object(Command, 'to_archive', add_comment_then_archive):
+            with self.assertRaises(CommandError):
+                call_command('archive_posts', days=365, stdout=StringIO())
+        self.assertTrue(Post.objects.filter(pk=self.old_post.pk).exists())
+        self.assertTrue(Comment.objects.filter(post=self.old_post, content="First!").exists())
+        self.assertEqual(Like.objects.count(), 1)
+        self.assertFalse(ArchivedPost.objects.exists())
+
+    def test_archived_payload_matches_live_payload(self):
+        live = self.client.get(f'/api/posts/{self.old_post.pk}/').data
+        call_command('archive_posts', days=365, stdout=StringIO())
+        archived = self.client.get(f'/api/posts/{self.old_post.pk}/').data
+        self.assertEqual(set(archived) - {'archived_at'}, set(live))
+        self.assertEqual(set(archived['comments'][0]), set(live['comments'][0]))
+        self.assertEqual(set(archived['comments'][0]['user']), set(live['comments'][0]['user']))
+        self.assertEqual(archived['comments'][0]['created_at'], live['comments'][0]['created_at'])
+
+    def test_retrieve_non_numeric_pk(self):
+        response = self.client.get('/api/posts/abc/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieve_and_timeline_fall_back_to_archive(self):
+        call_command('archive_posts', days=365, stdout=StringIO())
+        response = self.client.get(f'/api/posts/{self.old_post.pk}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['content'], "Old news")
+        self.assertEqual(response.data['likes_count'], 1)
+
+        for i in range(3):
+            post = Post.objects.create(user=self.user, content=f"Extra {i}")
+            Comment.objects.create(user=self.other, post=post, content="Nice")
+            Like.objects.create(user=self.other, post=post)
+        with self.assertNumQueries(8):
+            response = self.client.get(f'/api/users/{self.user.pk}/posts/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(
+            [p['content'] for p in response.data['results']],
+            ["Extra 2", "Extra 1", "Extra 0", "Fresh", "Old news"],
+        )
+        self.assertEqual(response.data['results'][0]['likes_count'], 1)
+
+class EstimatedCountPaginatorTestCase(TestCase):
+    def setUp(self):
+        caches['counts'].clear()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        Post.objects.bulk_create([Post(user=self.user, content=f"Post {i}") for i in range(3)])
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=3)
+    def test_unfiltered_count_is_cached(self):
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 3)
+        Post.objects.create(user=self.user, content="Another")
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 3)
+        self.assertEqual(EstimatedCountPaginator(Post.objects.filter(user=self.user).order_by('pk'), 10).count, 4)
+
+    def test_small_table_count_is_exact(self):
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 3)
+        Post.objects.create(user=self.user, content="Another")
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 4)
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=3)
+    def test_grouped_and_combined_querysets_are_exact(self):
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 3)
+        other = User.objects.create_user(username='other', password='testpassword')
+        Post.objects.create(user=other, content="Elsewhere")
+        per_user = Post.objects.values('user').annotate(total=Count('id')).order_by('user')
+        self.assertEqual(EstimatedCountPaginator(per_user, 10).count, 2)
+        combined = Post.objects.filter(user=self.user).union(Post.objects.filter(user=other)).order_by('pk')
+        self.assertEqual(EstimatedCountPaginator(combined, 10).count, 4)
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=3)
+    def test_archive_clears_cached_counts(self):
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 3)
+        Post.objects.create(user=self.user, content="Another")
+        call_command('archive_posts', days=365, stdout=StringIO())
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 4)
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=3)
+    def test_stale_count_does_not_hide_rows(self):
+        client = APIClient()
+        self.assertEqual(client.get('/api/posts/').data['count'], 3)
+        Post.objects.bulk_create([Post(user=self.user, content=f"New {i}") for i in range(11)])
+
+        first = client.get('/api/posts/')
+        self.assertEqual(len(first.data['results']), 10)
+        self.assertIsNotNone(first.data['next'])
+        second = client.get(first.data['next'])
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(second.data['results']), 4)
+        self.assertIsNone(second.data['next'])
+        self.assertEqual(client.get('/api/posts/?page=3').status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_admin_changelist(self):
+        admin_user = User.objects.create_superuser(username='admin', password='adminpassword')
+        self.client.force_login(admin_user)
+        for url in ['/admin/api/post/', '/admin/api/like/', '/admin/api/comment/', '/admin/api/follow/']:
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+class OpenAPISchemaTestCase(TestCase):
+    def test_live_schema_without_prebuilt_artifact(self):
+        with tempfile.TemporaryDirectory() as static_root, override_settings(STATIC_ROOT=static_root):
+            response = self.client.get('/swagger.json/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('/posts/', response.json()['paths'])
+
+    def test_prebuilt_schema_is_served_statically(self):
+        with tempfile.TemporaryDirectory() as static_root, override_settings(STATIC_ROOT=static_root):
+            call_command('build_openapi_schema', stdout=StringIO())
+            self.assertRedirects(self.client.get('/swagger.json/'), '/static/openapi/swagger.json', fetch_redirect_response=False)
+            self.assertRedirects(self.client.get('/redoc/?format=openapi'), '/static/openapi/swagger.json', fetch_redirect_response=False)
+            self.assertEqual(self.client.get('/swagger/').status_code, status.HTTP_200_OK)
+            with override_settings(DEBUG=True):
+                self.assertEqual(self.client.get('/swagger.json/').status_code, status.HTTP_200_OK)
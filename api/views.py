@@ -3,12 +3,15 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
+from django.http import Http404
 from django.shortcuts import redirect
 from rest_framework.views import APIView
 from django.contrib.auth import authenticate
+from django.db.models import Count
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Post, Follow, Comment, Like, Profile
-from .serializers import PostSerializer, UserSerializer, FollowSerializer, UserRegistrationSerializer, CommentSerializer, LoginSerializer
+from .models import Post, Follow, Comment, Like, Profile, ArchivedPost
+from .serializers import PostSerializer, UserSerializer, FollowSerializer, UserRegistrationSerializer, CommentSerializer, LoginSerializer, ArchivedPostSerializer, PostPageSerializer
+from .archive import ArchiveTimeline, serialize_timeline
 
 def root_redirect(request):
     return redirect('/api/')
@@ -58,6 +61,15 @@ class PostViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            # Fall back to the archive for posts moved out by `archive_posts`
+            archived = generics.get_object_or_404(ArchivedPost.objects.select_related('user__profile'), pk=kwargs['pk'])
+            serializer = ArchivedPostSerializer(archived, context=self.get_serializer_context())
+            return Response(serializer.data)
+
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def like(self, request, pk=None):
         post = self.get_object()
@@ -109,6 +121,12 @@ class UserViewSet(viewsets.ModelViewSet):
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    def get_serializer_class(self):
+        # The timeline serializes its own page; this lets the schema describe it
+        if self.action == 'posts':
+            return PostPageSerializer
+        return super().get_serializer_class()
+
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
@@ -176,4 +194,26 @@ class UserViewSet(viewsets.ModelViewSet):
     def unfollow(self, request, pk=None):
         target_user = self.get_object()
         Follow.objects.filter(follower=request.user, following=target_user).delete()
-        return Response({"message": f"You have unfollowed {target_user.username}"}, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response({"message": f"You have unfollowed {target_user.username}"}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def posts(self, request, pk=None):
+        """
+        Return the user's timeline, newest first, continuing into archived posts.
+        """
+        user = self.get_object()
+        posts = Post.objects.filter(user=user)
+        timeline = ArchiveTimeline(
+            posts.select_related('user__profile')
+            .prefetch_related('comments__user__profile')
+            .annotate(likes_total=Count('likes'))
+            .order_by('-created_at'),
+            ArchivedPost.objects.filter(user=user).select_related('user__profile').order_by('-created_at'),
+            counted_posts=posts,
+        )
+        context = self.get_serializer_context()
+        page = self.paginate_queryset(timeline)
+        if page is not None:
+            return self.get_paginated_response(serialize_timeline(page, context))
+
+        return Response(serialize_timeline(timeline[:], context))
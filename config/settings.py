@@ -25,7 +25,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = 'django-insecure-r=a+xw+h+r264+m3wzf_gr_fk5tkwhu_0oas*op_9y!g#8y$5c'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.getenv('DEBUG', 'True') == 'True'
 
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '').split(',') if os.getenv('ALLOWED_HOSTS') else ['*']
 
@@ -34,6 +34,25 @@ ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '').split(',') if os.getenv('ALLOWED_
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Posts older than this many days are moved to the archive by `manage.py archive_posts`
+POST_ARCHIVE_AFTER_DAYS = int(os.getenv('POST_ARCHIVE_AFTER_DAYS', '365'))
+
+# Unfiltered list/admin counts on tables above the threshold: Postgres planner estimates, cached exact counts elsewhere
+ESTIMATED_COUNT_THRESHOLD = int(os.getenv('ESTIMATED_COUNT_THRESHOLD', '10000'))
+ESTIMATED_COUNT_CACHE_TIMEOUT = int(os.getenv('ESTIMATED_COUNT_CACHE_TIMEOUT', '300'))
+ESTIMATED_COUNT_CACHE = 'counts'
+
+# The counts cache is shared by all workers and management commands; create its table with `manage.py createcachetable`
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'counts': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'estimated_counts',
+    },
+}
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -58,7 +77,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.EstimatedCountPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',